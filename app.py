@@ -1,36 +1,253 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 import plotly.express as px
+import plotly.graph_objects as go
 
 st.set_page_config(page_title="Employee Attrition Dashboard", layout="wide")
 
+# Columns used by the dashboard
+FILTER_COLUMNS = ["Department", "Gender", "Age", "MonthlyIncome"]
+# Columns shown in the filtered-data preview table
+PREVIEW_COLUMNS = ["Age", "Department", "JobRole", "MonthlyIncome", "Attrition", "Gender", "YearsAtCompany"]
+# Categorical columns charted as counts split by attrition
+COUNT_COLUMNS = [
+    "Attrition", "BusinessTravel", "Department", "EducationField", "Gender",
+    "JobRole", "MaritalStatus", "OverTime", "PerformanceRating",
+]
+RATE_COLUMNS = ["Department", "Gender"]
+# Numeric columns pre-binned server-side: column -> (approximate bin count, color column)
+HISTOGRAMS = {"YearsAtCompany": (15, "Attrition"), "Age": (20, None)}
+# Box plots drawn from precomputed statistics: (group column, value column)
+BOXES = [
+    ("Attrition", "DistanceFromHome"), ("JobRole", "MonthlyIncome"), ("Attrition", "MonthlyIncome"),
+    ("Attrition", "PercentSalaryHike"), ("Attrition", "JobSatisfaction"),
+    ("Attrition", "EnvironmentSatisfaction"), ("Attrition", "WorkLifeBalance"),
+    ("Attrition", "YearsSinceLastPromotion"), ("Attrition", "YearsWithCurrManager"),
+]
+# Numeric columns in the correlation heatmap. EmployeeCount and StandardHours
+# are constant and EmployeeNumber is an ID, so they carry no correlation.
+CORRELATION_COLUMNS = [
+    "Age", "DailyRate", "DistanceFromHome", "Education", "EnvironmentSatisfaction",
+    "HourlyRate", "JobInvolvement", "JobLevel", "JobSatisfaction", "MonthlyIncome",
+    "MonthlyRate", "NumCompaniesWorked", "PercentSalaryHike", "PerformanceRating",
+    "RelationshipSatisfaction", "StockOptionLevel", "TotalWorkingYears",
+    "TrainingTimesLastYear", "WorkLifeBalance", "YearsAtCompany", "YearsInCurrentRole",
+    "YearsSinceLastPromotion", "YearsWithCurrManager",
+]
+# Only these columns are read from disk; everything else in EA.parquet is skipped
+LOADED_COLUMNS = list(dict.fromkeys(
+    FILTER_COLUMNS + PREVIEW_COLUMNS + COUNT_COLUMNS + RATE_COLUMNS + list(HISTOGRAMS)
+    + [column for box in BOXES for column in box] + CORRELATION_COLUMNS
+))
+
 # Load data
+# EA.parquet is built from EA.csv by convert_data.py and already carries
+# categorical/downcast integer dtypes, so nothing is re-inferred at startup.
 @st.cache_data
 def load_data():
-    df = pd.read_csv("EA.csv")
+    df = pd.read_parquet("EA.parquet", columns=LOADED_COLUMNS)
+    # String labels keep the age groups JSON-serializable for Plotly
+    df["AgeGroup"] = pd.cut(df["Age"], bins=[18, 25, 35, 45, 55, 70]).cat.rename_categories(str)
+    # 0/1 attrition flag, so attrition rates are plain numeric means
+    df["AttritionYes"] = df["Attrition"].eq("Yes").astype("int8")
     return df
 
-df = load_data()
+# Dataset-wide constants, cached separately from the frame so each rerun
+# reads only this small dict instead of unpickling a copy of the data.
+# Sidebar options are the category labels (no unique() scans per rerun), and
+# the label -> code maps let the filter compare int8 category codes.
+@st.cache_data
+def load_meta():
+    df = load_data()
+    meta = {"options": {}, "codes": {}}
+    for column in ["Department", "Gender"]:
+        categories = df[column].cat.categories
+        meta["options"][column] = categories.tolist()
+        meta["codes"][column] = {label: code for code, label in enumerate(categories)}
+    # Slider bounds are dataset-wide constants
+    meta["ranges"] = {column: (int(df[column].min()), int(df[column].max())) for column in ["Age", "MonthlyIncome"]}
+    return meta
+
+meta = load_meta()
+options, ranges = meta["options"], meta["ranges"]
 
 # Sidebar Filters
 st.sidebar.header("Filter Data")
-departments = st.sidebar.multiselect("Department", df["Department"].unique(), default=list(df["Department"].unique()))
-genders = st.sidebar.multiselect("Gender", df["Gender"].unique(), default=list(df["Gender"].unique()))
-age_min, age_max = int(df["Age"].min()), int(df["Age"].max())
+departments = st.sidebar.multiselect("Department", options["Department"], default=options["Department"])
+genders = st.sidebar.multiselect("Gender", options["Gender"], default=options["Gender"])
+age_min, age_max = ranges["Age"]
 age_range = st.sidebar.slider("Age Range", age_min, age_max, (age_min, age_max))
-income_min, income_max = int(df["MonthlyIncome"].min()), int(df["MonthlyIncome"].max())
+income_min, income_max = ranges["MonthlyIncome"]
 income_range = st.sidebar.slider("Monthly Income Range", income_min, income_max, (income_min, income_max))
 
 # Filter Data
-df_filtered = df[
-    (df["Department"].isin(departments)) &
-    (df["Gender"].isin(genders)) &
-    (df["Age"].between(age_range[0], age_range[1])) &
-    (df["MonthlyIncome"].between(income_range[0], income_range[1]))
-]
+# Membership test on the int8 category codes of a categorical column
+def category_mask(df, column, labels, codes):
+    selected = np.fromiter((codes[column][label] for label in labels), np.int8, len(labels))
+    return np.isin(df[column].cat.codes.to_numpy(), selected)
+
+# Cached helpers are keyed on the hashable sidebar selection, so reruns with
+# unchanged filters (scrolling, switching tabs) skip the recomputation. The
+# slider ranges make the key space huge, so only the most recent selections
+# are kept.
+FILTER_CACHE_ENTRIES = 16
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def filter_data(filter_key):
+    departments, genders, age_range, income_range = filter_key
+    df = load_data()
+    codes = load_meta()["codes"]
+    # AND every predicate into one boolean buffer in place instead of
+    # allocating a temporary mask per predicate and per "&".
+    ages = df["Age"].to_numpy()
+    incomes = df["MonthlyIncome"].to_numpy()
+    mask = category_mask(df, "Department", departments, codes)
+    mask &= category_mask(df, "Gender", genders, codes)
+    mask &= ages >= age_range[0]
+    mask &= ages <= age_range[1]
+    mask &= incomes >= income_range[0]
+    mask &= incomes <= income_range[1]
+    return df.loc[mask]
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def compute_kpis(filter_key):
+    df_filtered = filter_data(filter_key)
+    return {
+        "count": len(df_filtered),
+        "attrition_rate": df_filtered["AttritionYes"].mean() if len(df_filtered) else 0,
+        "avg_age": df_filtered["Age"].mean(),
+        "avg_income": df_filtered["MonthlyIncome"].mean(),
+    }
+
+# Per-group mean over integer category codes in a single C-level pass
+# (np.bincount), bypassing pandas' groupby machinery. Empty groups are NaN.
+def group_mean(codes, values, n_groups):
+    counts = np.bincount(codes, minlength=n_groups)
+    sums = np.bincount(codes, weights=values, minlength=n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return sums / counts
+
+def group_mean_table(df_filtered, column, values, name):
+    categories = df_filtered[column].cat.categories
+    means = group_mean(df_filtered[column].cat.codes.to_numpy(), values, len(categories))
+    return pd.DataFrame({column: categories, name: means}).dropna(subset=[name]).reset_index(drop=True)
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def preview_rows(filter_key):
+    return filter_data(filter_key)[PREVIEW_COLUMNS].head(20)
+
+# Bin layout is fixed over the full dataset, so bars line up across filters
+@st.cache_data
+def histogram_bins(column, nbins):
+    df = load_data()
+    values = df[column]
+    lo, hi = int(values.min()), int(values.max())
+    return lo, max(1, round((hi - lo) / nbins))
+
+# Counts per fixed-width bin, placed at the bin center with an "a–b" label
+# of the integer values the bin covers for the hover text
+def binned_counts(df_filtered, column, nbins, color=None):
+    lo, width = histogram_bins(column, nbins)
+    starts = lo + (df_filtered[column].to_numpy(dtype=np.int64) - lo) // width * width
+    starts = pd.Series(starts, index=df_filtered.index, name="start")
+    keys = [starts] if color is None else [starts, df_filtered[color]]
+    counts = df_filtered.groupby(keys, observed=True).size().reset_index(name="count")
+    counts.insert(0, column, counts["start"] + width / 2)
+    ends = counts["start"] + width - 1
+    counts["Range"] = counts["start"].astype(str) if width == 1 else counts["start"].astype(str) + "–" + ends.astype(str)
+    return counts.drop(columns="start")
+
+# Quartiles, Tukey fences (most extreme values within 1.5 IQR) and the
+# outlying values per group. Quartiles use the Hazen definition (position
+# p*n - 0.5), which is how Plotly computes box quartiles client-side.
+BOX_STATS_COLUMNS = ["q1", "median", "q3", "lowerfence", "upperfence", "outliers"]
+
+def box_stats(df_filtered, by, column):
+    rows = {}
+    for group, values in df_filtered[column].groupby(df_filtered[by], observed=True):
+        values = values.to_numpy()
+        q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75], method="hazen")
+        iqr = q3 - q1
+        outside = (values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)
+        inside = values[~outside]
+        rows[group] = [q1, median, q3, inside.min(), inside.max(), values[outside]]
+    return pd.DataFrame.from_dict(rows, orient="index", columns=BOX_STATS_COLUMNS)
+
+# All aggregate tables the charts need, computed in one pass over the filtered
+# frame, so each chart renders from a small aggregate instead of raw rows.
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def aggregates(filter_key):
+    df_filtered = filter_data(filter_key)
+    aggs = {}
+    for column in COUNT_COLUMNS:
+        keys = [column] if column == "Attrition" else [column, "Attrition"]
+        aggs[f"{column}_counts"] = df_filtered.groupby(keys, observed=True).size().reset_index(name="count")
+    for column, (nbins, color) in HISTOGRAMS.items():
+        aggs[f"{column}_hist"] = binned_counts(df_filtered, column, nbins, color)
+    # Attrition rate per group is the mean of the 0/1 flag per group
+    is_yes = df_filtered["AttritionYes"].to_numpy()
+    for column in RATE_COLUMNS:
+        aggs[f"{column}_rate"] = group_mean_table(df_filtered, column, is_yes, "Rate")
+    for by, column in BOXES:
+        aggs[f"{column}_by_{by}_box"] = box_stats(df_filtered, by, column)
+    # Row-normalized attrition share per age group from one groupby-size pass,
+    # cheaper than pd.crosstab's pivot_table route
+    age_counts = df_filtered.groupby(["AgeGroup", "Attrition"], observed=True).size().unstack(fill_value=0)
+    aggs["age_attrition"] = age_counts.div(age_counts.sum(axis=1), axis=0)
+    aggs["correlation"] = df_filtered[CORRELATION_COLUMNS].corr()
+    return aggs
+
+# Figures
+# Plotly figures are cached on the same filter key, so a rerun only rebuilds
+# the charts whose inputs actually changed. They use st.cache_resource, which
+# hands back the stored object instead of a deep copy on every hit: callers
+# must treat the returned figures as read-only and never mutate them in place.
+# The figures are shared by every session, so they are bounded to the 25
+# charts of a few recent filter selections and expire after an hour.
+FIGURE_CACHE_ENTRIES = 4 * 25
+FIGURE_CACHE_TTL = "1h"
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES, ttl=FIGURE_CACHE_TTL)
+def aggregate_figure(filter_key, kind, table, layout=None, **kwargs):
+    fig = getattr(px, kind)(aggregates(filter_key)[table], **kwargs)
+    if layout:
+        fig.update_layout(**layout)
+    return fig
+
+# Boxes are built from the precomputed statistics, so the figure holds a fixed
+# number of shapes plus one marker per outlier, regardless of how many rows
+# are in the filter.
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES, ttl=FIGURE_CACHE_TTL)
+def box_figure(filter_key, by, column, color=True):
+    stats = aggregates(filter_key)[f"{column}_by_{by}_box"]
+    colors = px.colors.qualitative.Plotly
+    def box(groups, index, name=None):
+        rows = stats.loc[groups]
+        labels = [str(g) for g in groups]
+        outliers = [value for values in rows["outliers"] for value in values.tolist()]
+        outlier_labels = [label for label, values in zip(labels, rows["outliers"]) for _ in values]
+        return [
+            go.Box(
+                x=labels, name=name, q1=rows["q1"], median=rows["median"], q3=rows["q3"],
+                lowerfence=rows["lowerfence"], upperfence=rows["upperfence"],
+                marker_color=colors[index % len(colors)], legendgroup=name,
+            ),
+            go.Scatter(
+                x=outlier_labels, y=outliers, mode="markers", name=name, showlegend=False,
+                marker_color=colors[index % len(colors)], legendgroup=name,
+            ),
+        ]
+    if color:
+        traces = [trace for i, g in enumerate(stats.index) for trace in box([g], i, str(g))]
+    else:
+        traces = box(list(stats.index), 0)
+    fig = go.Figure(traces)
+    fig.update_layout(xaxis_title=by, yaxis_title=column, legend_title_text=by, showlegend=color)
+    return fig
+
+filter_key = (tuple(departments), tuple(genders), age_range, income_range)
+kpis = compute_kpis(filter_key)
 
 # Main Title
 st.title("📊 Employee Attrition Insights Dashboard")
@@ -39,11 +256,10 @@ st.markdown("This dashboard enables HR Directors and stakeholders to deeply expl
 # KPI Section
 st.markdown("### 🔑 Key Metrics (for current filters)")
 col1, col2, col3, col4 = st.columns(4)
-col1.metric("Total Employees", len(df_filtered))
-attrition_rate = df_filtered["Attrition"].value_counts(normalize=True).get("Yes", 0)
-col2.metric("Attrition Rate (%)", f"{attrition_rate * 100:.1f}%")
-col3.metric("Avg Age", f"{df_filtered['Age'].mean():.1f}")
-col4.metric("Avg Monthly Income", f"{df_filtered['MonthlyIncome'].mean():,.0f}")
+col1.metric("Total Employees", kpis["count"])
+col2.metric("Attrition Rate (%)", f"{kpis['attrition_rate'] * 100:.1f}%")
+col3.metric("Avg Age", f"{kpis['avg_age']:.1f}")
+col4.metric("Avg Monthly Income", f"{kpis['avg_income']:,.0f}")
 
 # Tabs
 tab1, tab2, tab3, tab4, tab5 = st.tabs([
@@ -51,164 +267,180 @@ tab1, tab2, tab3, tab4, tab5 = st.tabs([
 ])
 
 # -------- TAB 1: OVERVIEW --------
-with tab1:
+@st.fragment
+def render_overview(filter_key):
     st.header("🔍 Dataset Overview & Macro Analysis")
     st.write("Get a snapshot of your HR data and trends at a glance.")
 
     st.markdown("**Preview of Filtered Data**")
-    st.dataframe(df_filtered.head(20), use_container_width=True)
+    st.dataframe(preview_rows(filter_key), use_container_width=True, key="preview_grid")
 
     st.markdown("**1. Department-wise Employee Count**")
     st.write("Distribution of employees across departments shows workforce structure.")
-    fig = px.histogram(df_filtered, x="Department", color="Attrition", barmode="group")
-    st.plotly_chart(fig, use_container_width=True)
+    fig = aggregate_figure(filter_key, "bar", "Department_counts", x="Department", y="count", color="Attrition", barmode="group")
+    st.plotly_chart(fig, use_container_width=True, key="chart_1")
 
     st.markdown("**2. Correlation Heatmap**")
     st.write("Correlation between numeric features to spot strong drivers.")
-    corr = df_filtered.select_dtypes(include=np.number).corr()
-    fig, ax = plt.subplots(figsize=(8, 4))
-    sns.heatmap(corr, annot=True, cmap='coolwarm', ax=ax)
-    st.pyplot(fig)
+    fig = aggregate_figure(filter_key, "imshow", "correlation", text_auto=".2f", color_continuous_scale="RdBu_r", zmin=-1, zmax=1, aspect="auto")
+    st.plotly_chart(fig, use_container_width=True, key="chart_2")
 
     st.markdown("**3. Attrition Count**")
     st.write("See overall attrition balance (Yes/No).")
-    fig = px.histogram(df_filtered, x="Attrition", color="Attrition")
-    st.plotly_chart(fig, use_container_width=True)
+    fig = aggregate_figure(filter_key, "bar", "Attrition_counts", x="Attrition", y="count", color="Attrition")
+    st.plotly_chart(fig, use_container_width=True, key="chart_3")
 
     st.markdown("**4. Attrition Rate by Department**")
     st.write("Which departments lose more employees?")
-    group = df_filtered.groupby("Department")["Attrition"].value_counts(normalize=True).rename("Rate").reset_index()
-    group = group[group["Attrition"]=="Yes"]
-    fig = px.bar(group, x="Department", y="Rate", text="Rate", labels={"Rate": "Attrition Rate"})
-    st.plotly_chart(fig, use_container_width=True)
+    fig = aggregate_figure(filter_key, "bar", "Department_rate", x="Department", y="Rate", text="Rate", labels={"Rate": "Attrition Rate"})
+    st.plotly_chart(fig, use_container_width=True, key="chart_4")
 
 # -------- TAB 2: ATTRITION --------
-with tab2:
+@st.fragment
+def render_attrition(filter_key):
     st.header("📉 Attrition Deep Dive")
     st.write("Explore employee attrition by multiple business variables.")
 
     st.markdown("**5. Attrition by Age Group**")
     st.write("Identifies at-risk age cohorts.")
-    age_bins = pd.cut(df_filtered["Age"], bins=[18, 25, 35, 45, 55, 70])
-    age_attr = pd.crosstab(age_bins, df_filtered["Attrition"], normalize='index')
-    fig = px.bar(age_attr, barmode="group", title="Attrition Rate by Age Group")
-    st.plotly_chart(fig, use_container_width=True)
+    fig = aggregate_figure(filter_key, "bar", "age_attrition", barmode="group", title="Attrition Rate by Age Group")
+    st.plotly_chart(fig, use_container_width=True, key="chart_5")
 
     st.markdown("**6. Attrition by Education Field**")
     st.write("Reveals which education fields see more churn.")
-    fig = px.histogram(df_filtered, x="EducationField", color="Attrition", barmode="group")
-    st.plotly_chart(fig, use_container_width=True)
+    fig = aggregate_figure(filter_key, "bar", "EducationField_counts", x="EducationField", y="count", color="Attrition", barmode="group")
+    st.plotly_chart(fig, use_container_width=True, key="chart_6")
 
     st.markdown("**7. Attrition by Business Travel**")
     st.write("Does frequent travel cause attrition?")
-    fig = px.histogram(df_filtered, x="BusinessTravel", color="Attrition", barmode="group")
-    st.plotly_chart(fig, use_container_width=True)
+    fig = aggregate_figure(filter_key, "bar", "BusinessTravel_counts", x="BusinessTravel", y="count", color="Attrition", barmode="group")
+    st.plotly_chart(fig, use_container_width=True, key="chart_7")
 
     st.markdown("**8. Attrition by Job Role**")
     st.write("Find out which job roles are most/least stable.")
-    fig = px.histogram(df_filtered, x="JobRole", color="Attrition", barmode="group")
-    st.plotly_chart(fig, use_container_width=True)
+    fig = aggregate_figure(filter_key, "bar", "JobRole_counts", x="JobRole", y="count", color="Attrition", barmode="group")
+    st.plotly_chart(fig, use_container_width=True, key="chart_8")
 
     st.markdown("**9. Years at Company vs Attrition**")
     st.write("Are newcomers or veterans leaving more?")
-    fig = px.histogram(df_filtered, x="YearsAtCompany", color="Attrition", nbins=15)
-    st.plotly_chart(fig, use_container_width=True)
+    fig = aggregate_figure(
+        filter_key, "bar", "YearsAtCompany_hist", x="YearsAtCompany", y="count", color="Attrition",
+        hover_data={"YearsAtCompany": False, "Range": True}, labels={"Range": "YearsAtCompany"},
+        layout={"bargap": 0},
+    )
+    st.plotly_chart(fig, use_container_width=True, key="chart_9")
 
     st.markdown("**10. Distance from Home vs Attrition**")
     st.write("Long commutes and attrition rates.")
-    fig = px.box(df_filtered, x="Attrition", y="DistanceFromHome")
-    st.plotly_chart(fig, use_container_width=True)
+    fig = box_figure(filter_key, "Attrition", "DistanceFromHome", color=False)
+    st.plotly_chart(fig, use_container_width=True, key="chart_10")
 
 # -------- TAB 3: DEMOGRAPHICS --------
-with tab3:
+@st.fragment
+def render_demographics(filter_key):
     st.header("👥 Demographics & Diversity")
     st.write("Analyze the workforce by gender, marital status, and diversity measures.")
 
     st.markdown("**11. Gender Distribution**")
     st.write("Male/Female distribution across organization.")
-    fig = px.pie(df_filtered, names="Gender", title="Gender Distribution")
-    st.plotly_chart(fig, use_container_width=True)
+    fig = aggregate_figure(filter_key, "pie", "Gender_counts", names="Gender", values="count", title="Gender Distribution")
+    st.plotly_chart(fig, use_container_width=True, key="chart_11")
 
     st.markdown("**12. Marital Status Distribution**")
     st.write("Workforce by marital status.")
-    fig = px.pie(df_filtered, names="MaritalStatus", title="Marital Status")
-    st.plotly_chart(fig, use_container_width=True)
+    fig = aggregate_figure(filter_key, "pie", "MaritalStatus_counts", names="MaritalStatus", values="count", title="Marital Status")
+    st.plotly_chart(fig, use_container_width=True, key="chart_12")
 
     st.markdown("**13. Attrition by Gender**")
     st.write("Does gender impact attrition?")
-    gender_attr = df_filtered.groupby("Gender")["Attrition"].value_counts(normalize=True).rename("Rate").reset_index()
-    gender_attr = gender_attr[gender_attr["Attrition"]=="Yes"]
-    fig = px.bar(gender_attr, x="Gender", y="Rate", text="Rate", labels={"Rate": "Attrition Rate"})
-    st.plotly_chart(fig, use_container_width=True)
+    fig = aggregate_figure(filter_key, "bar", "Gender_rate", x="Gender", y="Rate", text="Rate", labels={"Rate": "Attrition Rate"})
+    st.plotly_chart(fig, use_container_width=True, key="chart_13")
 
     st.markdown("**14. Attrition by Marital Status**")
     st.write("Attrition by marital status.")
-    fig = px.histogram(df_filtered, x="MaritalStatus", color="Attrition", barmode="group")
-    st.plotly_chart(fig, use_container_width=True)
+    fig = aggregate_figure(filter_key, "bar", "MaritalStatus_counts", x="MaritalStatus", y="count", color="Attrition", barmode="group")
+    st.plotly_chart(fig, use_container_width=True, key="chart_14")
 
     st.markdown("**15. Age Distribution**")
     st.write("Age spread of the workforce.")
-    fig = px.histogram(df_filtered, x="Age", nbins=20)
-    st.plotly_chart(fig, use_container_width=True)
+    fig = aggregate_figure(
+        filter_key, "bar", "Age_hist", x="Age", y="count",
+        hover_data={"Age": False, "Range": True}, labels={"Range": "Age"}, layout={"bargap": 0},
+    )
+    st.plotly_chart(fig, use_container_width=True, key="chart_15")
 
 # -------- TAB 4: COMPENSATION --------
-with tab4:
+@st.fragment
+def render_compensation(filter_key):
     st.header("💵 Compensation Analysis")
     st.write("Drill down on salary, incentives, and benefits.")
 
     st.markdown("**16. Monthly Income by Job Role**")
     st.write("Salary distribution by job role.")
-    fig = px.box(df_filtered, x="JobRole", y="MonthlyIncome", color="JobRole")
-    st.plotly_chart(fig, use_container_width=True)
+    fig = box_figure(filter_key, "JobRole", "MonthlyIncome")
+    st.plotly_chart(fig, use_container_width=True, key="chart_16")
 
     st.markdown("**17. Monthly Income by Attrition**")
     st.write("Income distribution among stayers/leavers.")
-    fig = px.box(df_filtered, x="Attrition", y="MonthlyIncome", color="Attrition")
-    st.plotly_chart(fig, use_container_width=True)
+    fig = box_figure(filter_key, "Attrition", "MonthlyIncome")
+    st.plotly_chart(fig, use_container_width=True, key="chart_17")
 
     st.markdown("**18. Overtime vs Attrition**")
     st.write("Does overtime work link to attrition?")
-    fig = px.histogram(df_filtered, x="OverTime", color="Attrition", barmode="group")
-    st.plotly_chart(fig, use_container_width=True)
+    fig = aggregate_figure(filter_key, "bar", "OverTime_counts", x="OverTime", y="count", color="Attrition", barmode="group")
+    st.plotly_chart(fig, use_container_width=True, key="chart_18")
 
     st.markdown("**19. Percent Salary Hike by Attrition**")
     st.write("Salary growth vs attrition.")
-    fig = px.box(df_filtered, x="Attrition", y="PercentSalaryHike", color="Attrition")
-    st.plotly_chart(fig, use_container_width=True)
+    fig = box_figure(filter_key, "Attrition", "PercentSalaryHike")
+    st.plotly_chart(fig, use_container_width=True, key="chart_19")
 
 # -------- TAB 5: PERFORMANCE & SATISFACTION --------
-with tab5:
+@st.fragment
+def render_performance(filter_key):
     st.header("📈 Performance, Engagement & Satisfaction")
     st.write("Find patterns in ratings, satisfaction, and promotion.")
 
     st.markdown("**20. Job Satisfaction by Attrition**")
     st.write("Are unsatisfied employees leaving more?")
-    fig = px.box(df_filtered, x="Attrition", y="JobSatisfaction", color="Attrition", points="all")
-    st.plotly_chart(fig, use_container_width=True)
+    fig = box_figure(filter_key, "Attrition", "JobSatisfaction")
+    st.plotly_chart(fig, use_container_width=True, key="chart_20")
 
     st.markdown("**21. Environment Satisfaction by Attrition**")
     st.write("Satisfaction with work environment and attrition.")
-    fig = px.box(df_filtered, x="Attrition", y="EnvironmentSatisfaction", color="Attrition", points="all")
-    st.plotly_chart(fig, use_container_width=True)
+    fig = box_figure(filter_key, "Attrition", "EnvironmentSatisfaction")
+    st.plotly_chart(fig, use_container_width=True, key="chart_21")
 
     st.markdown("**22. Performance Rating Distribution**")
     st.write("Performance rating across the workforce.")
-    fig = px.histogram(df_filtered, x="PerformanceRating", color="Attrition", barmode="group")
-    st.plotly_chart(fig, use_container_width=True)
+    fig = aggregate_figure(filter_key, "bar", "PerformanceRating_counts", x="PerformanceRating", y="count", color="Attrition", barmode="group")
+    st.plotly_chart(fig, use_container_width=True, key="chart_22")
 
     st.markdown("**23. Work Life Balance by Attrition**")
     st.write("Correlation between work-life balance and attrition.")
-    fig = px.box(df_filtered, x="Attrition", y="WorkLifeBalance", color="Attrition", points="all")
-    st.plotly_chart(fig, use_container_width=True)
+    fig = box_figure(filter_key, "Attrition", "WorkLifeBalance")
+    st.plotly_chart(fig, use_container_width=True, key="chart_23")
 
     st.markdown("**24. Years Since Last Promotion vs Attrition**")
     st.write("Do employees who are not promoted leave more?")
-    fig = px.box(df_filtered, x="Attrition", y="YearsSinceLastPromotion", color="Attrition", points="all")
-    st.plotly_chart(fig, use_container_width=True)
+    fig = box_figure(filter_key, "Attrition", "YearsSinceLastPromotion")
+    st.plotly_chart(fig, use_container_width=True, key="chart_24")
 
     st.markdown("**25. Years With Current Manager by Attrition**")
     st.write("Relationship with manager and attrition.")
-    fig = px.box(df_filtered, x="Attrition", y="YearsWithCurrManager", color="Attrition", points="all")
-    st.plotly_chart(fig, use_container_width=True)
+    fig = box_figure(filter_key, "Attrition", "YearsWithCurrManager")
+    st.plotly_chart(fig, use_container_width=True, key="chart_25")
+
+# Each tab body is a fragment, so interactions within a tab rerun only that tab
+with tab1:
+    render_overview(filter_key)
+with tab2:
+    render_attrition(filter_key)
+with tab3:
+    render_demographics(filter_key)
+with tab4:
+    render_compensation(filter_key)
+with tab5:
+    render_performance(filter_key)
 
 st.info("All charts above are interactive. Adjust the filters in the sidebar for micro and macro insights!")
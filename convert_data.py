@@ -0,0 +1,29 @@
+# Build EA.parquet from EA.csv with compact dtypes.
+# Run once whenever EA.csv changes: python convert_data.py
+import pandas as pd
+
+CATEGORICAL_COLUMNS = [
+    "Attrition", "BusinessTravel", "Department", "EducationField", "Gender",
+    "JobRole", "MaritalStatus", "Over18", "OverTime",
+]
+INT8_COLUMNS = [
+    "Age", "DistanceFromHome", "Education", "EmployeeCount", "EnvironmentSatisfaction",
+    "HourlyRate", "JobInvolvement", "JobLevel", "JobSatisfaction", "NumCompaniesWorked",
+    "PercentSalaryHike", "PerformanceRating", "RelationshipSatisfaction", "StandardHours",
+    "StockOptionLevel", "TotalWorkingYears", "TrainingTimesLastYear", "WorkLifeBalance",
+    "YearsAtCompany", "YearsInCurrentRole", "YearsSinceLastPromotion", "YearsWithCurrManager",
+]
+INT16_COLUMNS = ["DailyRate", "EmployeeNumber"]
+INT32_COLUMNS = ["MonthlyIncome", "MonthlyRate"]
+
+DTYPES = {
+    **{col: "category" for col in CATEGORICAL_COLUMNS},
+    **{col: "int8" for col in INT8_COLUMNS},
+    **{col: "int16" for col in INT16_COLUMNS},
+    **{col: "int32" for col in INT32_COLUMNS},
+}
+
+if __name__ == "__main__":
+    df = pd.read_csv("EA.csv", dtype=DTYPES)
+    df.to_parquet("EA.parquet", index=False)
+    print(f"Wrote EA.parquet ({len(df)} rows)")